@@ -1,4 +1,5 @@
 use std::fs;
+use std::io::Write;
 use std::path::{Path, PathBuf};
 use std::process::ExitCode;
 use std::time::Duration;
@@ -1385,18 +1386,52 @@ fn write_json<T>(path: &Path, value: &T) -> Result<()>
 where
     T: serde::Serialize,
 {
-    if let Some(parent) = path.parent() {
-        fs::create_dir_all(parent).with_context(|| format!("create {}", parent.display()))?;
-    }
     let text = serde_json::to_string_pretty(value).context("serialize JSON")?;
     write_text(path, &(text + "\n"))
 }
 
 fn write_text(path: &Path, text: &str) -> Result<()> {
-    if let Some(parent) = path.parent() {
-        fs::create_dir_all(parent).with_context(|| format!("create {}", parent.display()))?;
+    use std::os::unix::fs::PermissionsExt;
+
+    // Like fs::write, an existing symlink at `path` is written through to
+    // its target rather than replaced by a regular file.
+    let target = match fs::symlink_metadata(path) {
+        Ok(metadata) if metadata.file_type().is_symlink() => {
+            fs::canonicalize(path).with_context(|| format!("resolve symlink {}", path.display()))?
+        }
+        _ => path.to_path_buf(),
+    };
+    let dir = match target.parent() {
+        Some(parent) if !parent.as_os_str().is_empty() => parent,
+        _ => Path::new("."),
+    };
+    fs::create_dir_all(dir).with_context(|| format!("create {}", dir.display()))?;
+
+    // Write a uniquely named temp file in the same directory, fsync it, and
+    // rename it into place: readers never see a truncated file (after a host
+    // crash they find the old or the new contents), and the temp file is
+    // deleted on drop if any step fails.
+    // Match fs::write's modes too: a new file gets 0o666 filtered by the
+    // process umask (not NamedTempFile's 0o600), and an existing file keeps
+    // its mode.
+    let mut temp = tempfile::Builder::new()
+        .permissions(fs::Permissions::from_mode(0o666))
+        .tempfile_in(dir)
+        .with_context(|| format!("create temp file in {}", dir.display()))?;
+    if let Ok(existing) = fs::metadata(&target) {
+        temp.as_file()
+            .set_permissions(existing.permissions())
+            .with_context(|| format!("copy mode of {}", target.display()))?;
     }
-    fs::write(path, text).with_context(|| format!("write {}", path.display()))
+    temp.write_all(text.as_bytes())
+        .with_context(|| format!("write {}", temp.path().display()))?;
+    temp.as_file()
+        .sync_all()
+        .with_context(|| format!("sync {}", temp.path().display()))?;
+    temp.persist(&target)
+        .map_err(|err| err.error)
+        .with_context(|| format!("write {}", path.display()))?;
+    Ok(())
 }
 
 fn sibling_path(out: &Path, filename: &str) -> PathBuf {
@@ -1591,6 +1626,68 @@ mod tests {
         }
     }
 
+    #[test]
+    fn write_text_replaces_existing_file_without_leaving_temp_files() {
+        let dir = tempfile::tempdir().expect("tempdir");
+        let path = dir.path().join("nested").join("artifact.json");
+        write_text(&path, "first\n").expect("first write");
+        write_text(&path, "second\n").expect("overwrite");
+
+        assert_eq!(fs::read_to_string(&path).unwrap(), "second\n");
+        let entries: Vec<_> = fs::read_dir(dir.path().join("nested"))
+            .unwrap()
+            .map(|entry| entry.unwrap().file_name())
+            .collect();
+        assert_eq!(entries, vec![std::ffi::OsString::from("artifact.json")]);
+    }
+
+    #[test]
+    fn write_text_gives_new_files_the_same_mode_as_fs_write() {
+        use std::os::unix::fs::PermissionsExt;
+
+        let dir = tempfile::tempdir().expect("tempdir");
+        let reference = dir.path().join("reference.json");
+        fs::write(&reference, "{}\n").expect("write reference file");
+        let path = dir.path().join("artifact.json");
+        write_text(&path, "{}\n").expect("write artifact");
+
+        let mode = |file: &Path| fs::metadata(file).unwrap().permissions().mode() & 0o777;
+        assert_eq!(mode(&path), mode(&reference));
+    }
+
+    #[test]
+    fn write_text_keeps_an_existing_file_mode() {
+        use std::os::unix::fs::PermissionsExt;
+
+        let dir = tempfile::tempdir().expect("tempdir");
+        let path = dir.path().join("artifact.json");
+        fs::write(&path, "old\n").expect("write existing file");
+        fs::set_permissions(&path, fs::Permissions::from_mode(0o640)).expect("chmod");
+        write_text(&path, "new\n").expect("overwrite");
+
+        assert_eq!(fs::read_to_string(&path).unwrap(), "new\n");
+        assert_eq!(
+            fs::metadata(&path).unwrap().permissions().mode() & 0o777,
+            0o640
+        );
+    }
+
+    #[test]
+    fn write_text_writes_through_a_symlink() {
+        let dir = tempfile::tempdir().expect("tempdir");
+        let real = dir.path().join("real.json");
+        fs::write(&real, "old\n").expect("write link target");
+        let link = dir.path().join("out.json");
+        std::os::unix::fs::symlink(&real, &link).expect("create symlink");
+        write_text(&link, "new\n").expect("write through symlink");
+
+        assert!(fs::symlink_metadata(&link)
+            .unwrap()
+            .file_type()
+            .is_symlink());
+        assert_eq!(fs::read_to_string(&real).unwrap(), "new\n");
+    }
+
     #[test]
     fn provisioning_key_resolves_from_file() {
         let dir = tempfile::tempdir().expect("tempdir");
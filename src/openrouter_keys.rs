@@ -45,8 +45,15 @@ pub struct KeyRecord {
 /// Client for OpenRouter's key-provisioning (management) API. The
 /// provisioning key stays host-side and never enters the review substrate —
 /// it is secret-zero, distinct from the scoped keys it mints.
+///
+/// All calls share one `ureq::Agent`, so the back-to-back calls in
+/// [`mint_review_key`] -- the orphan sweep's list-then-revoke burst and the
+/// mint right after it -- can reuse one pooled keep-alive connection instead
+/// of a fresh TCP+TLS handshake each. The end-of-review revoke comes minutes
+/// later and will usually reconnect.
 #[derive(Debug, Clone)]
 pub struct ProvisioningClient {
+    agent: ureq::Agent,
     base_url: String,
     provisioning_key: String,
 }
@@ -54,6 +61,7 @@ pub struct ProvisioningClient {
 impl ProvisioningClient {
     pub fn new(provisioning_key: impl Into<String>) -> Self {
         Self {
+            agent: ureq::Agent::new_with_defaults(),
             base_url: DEFAULT_BASE_URL.to_string(),
             provisioning_key: provisioning_key.into(),
         }
@@ -62,6 +70,7 @@ impl ProvisioningClient {
     #[cfg(test)]
     fn with_base_url(provisioning_key: impl Into<String>, base_url: impl Into<String>) -> Self {
         Self {
+            agent: ureq::Agent::new_with_defaults(),
             base_url: base_url.into(),
             provisioning_key: provisioning_key.into(),
         }
@@ -76,7 +85,9 @@ impl ProvisioningClient {
     pub fn mint_key(&self, name: &str, limit_usd: f64) -> Result<MintedKey> {
         let url = format!("{}/keys", self.base_url);
         let body = serde_json::json!({ "name": name, "limit": limit_usd });
-        let mut response = ureq::post(&url)
+        let mut response = self
+            .agent
+            .post(&url)
             .header("Authorization", self.auth_header())
             .header("Content-Type", "application/json")
             .send_json(&body)
@@ -108,13 +119,23 @@ impl ProvisioningClient {
     /// holds.
     pub fn revoke_key(&self, hash: &str) -> Result<()> {
         let url = format!("{}/keys/{hash}", self.base_url);
-        match ureq::delete(&url)
+        let mut response = self
+            .agent
+            .delete(&url)
             .header("Authorization", self.auth_header())
+            .config()
+            .http_status_as_error(false)
+            .build()
             .call()
-        {
-            Ok(_) => Ok(()),
-            Err(ureq::Error::StatusCode(404)) => Ok(()),
-            Err(err) => Err(err).with_context(|| format!("revoke OpenRouter key {hash}")),
+            .with_context(|| format!("revoke OpenRouter key {hash}"))?;
+        // Read the body to EOF even though it is unused: ureq only returns a
+        // connection to the pool once its response body is fully consumed.
+        let _ = response.body_mut().read_to_vec();
+        let status = response.status();
+        if status.is_success() || status.as_u16() == 404 {
+            Ok(())
+        } else {
+            Err(anyhow!("revoke OpenRouter key {hash}: HTTP {status}"))
         }
     }
 
@@ -122,7 +143,9 @@ impl ProvisioningClient {
     /// the sweeper does not need to paginate through history).
     pub fn list_keys(&self) -> Result<Vec<KeyRecord>> {
         let url = format!("{}/keys", self.base_url);
-        let mut response = ureq::get(&url)
+        let mut response = self
+            .agent
+            .get(&url)
             .header("Authorization", self.auth_header())
             .call()
             .context("list OpenRouter keys")?;
@@ -300,15 +323,43 @@ mod tests {
         let handle = thread::spawn(move || {
             let mut recorded = Vec::new();
             for (status, body) in responses {
-                let (stream, _) = listener.accept().expect("accept mock connection");
-                recorded.push(handle_one_request(stream, status, &body));
+                let (mut stream, _) = listener.accept().expect("accept mock connection");
+                recorded.push(handle_one_request(&mut stream, status, &body, false));
             }
             recorded
         });
         (format!("http://{addr}"), handle)
     }
 
-    fn handle_one_request(mut stream: TcpStream, status: u16, body: &str) -> RecordedRequest {
+    /// Like [`spawn_mock_server`], but serves every response on the first
+    /// accepted connection without `Connection: close`, so the client must
+    /// reuse it. A client that reconnects instead is never accepted, and the
+    /// read timeout on the first connection turns that into a test failure
+    /// rather than a hang.
+    fn spawn_keep_alive_mock_server(
+        responses: Vec<(u16, String)>,
+    ) -> (String, thread::JoinHandle<Vec<RecordedRequest>>) {
+        let listener = TcpListener::bind("127.0.0.1:0").expect("bind mock server");
+        let addr = listener.local_addr().expect("mock server addr");
+        let handle = thread::spawn(move || {
+            let (mut stream, _) = listener.accept().expect("accept mock connection");
+            stream
+                .set_read_timeout(Some(Duration::from_secs(5)))
+                .expect("set mock read timeout");
+            responses
+                .into_iter()
+                .map(|(status, body)| handle_one_request(&mut stream, status, &body, true))
+                .collect()
+        });
+        (format!("http://{addr}"), handle)
+    }
+
+    fn handle_one_request(
+        stream: &mut TcpStream,
+        status: u16,
+        body: &str,
+        keep_alive: bool,
+    ) -> RecordedRequest {
         let read_half = stream.try_clone().expect("clone mock stream for reading");
         let mut reader = BufReader::new(read_half);
 
@@ -344,8 +395,9 @@ mod tests {
             reader.read_exact(&mut body_buf).expect("read request body");
         }
 
+        let connection = if keep_alive { "keep-alive" } else { "close" };
         let response = format!(
-            "HTTP/1.1 {status} status\r\nContent-Type: application/json\r\nContent-Length: {}\r\nConnection: close\r\n\r\n{}",
+            "HTTP/1.1 {status} status\r\nContent-Type: application/json\r\nContent-Length: {}\r\nConnection: {connection}\r\n\r\n{}",
             body.len(),
             body
         );
@@ -417,6 +469,52 @@ mod tests {
         );
     }
 
+    #[test]
+    fn sweep_revokes_and_mint_reuse_one_keep_alive_connection() {
+        let (base_url, handle) = spawn_keep_alive_mock_server(vec![
+            (
+                200,
+                serde_json::json!({ "data": [
+                    { "hash": "hash-stale-1", "name": "cerberus-review-1-old", "disabled": false },
+                    { "hash": "hash-stale-2", "name": "cerberus-review-2-old", "disabled": false }
+                ] })
+                .to_string(),
+            ),
+            (200, "{}".to_string()),
+            (404, "{}".to_string()), // already gone still drains and reuses
+            (
+                201,
+                serde_json::json!({
+                    "key": "sk-or-v1-fresh",
+                    "data": { "hash": "hash-fresh", "name": "irrelevant", "disabled": false }
+                })
+                .to_string(),
+            ),
+        ]);
+        let client = ProvisioningClient::with_base_url("mgmt-key", base_url);
+
+        let minted = mint_review_key(&client, "review-42", 5.0, Duration::from_secs(1800))
+            .expect("sweep then mint succeeds");
+        assert_eq!(minted.hash, "hash-fresh");
+
+        let requests = handle
+            .join()
+            .expect("every request arrives on the one accepted connection");
+        let calls: Vec<(&str, &str)> = requests
+            .iter()
+            .map(|request| (request.method.as_str(), request.path.as_str()))
+            .collect();
+        assert_eq!(
+            calls,
+            vec![
+                ("GET", "/keys"),
+                ("DELETE", "/keys/hash-stale-1"),
+                ("DELETE", "/keys/hash-stale-2"),
+                ("POST", "/keys"),
+            ]
+        );
+    }
+
     #[test]
     fn revoke_key_treats_404_as_already_gone_success() {
         let (base_url, handle) = spawn_mock_server(vec![(404, "{}".to_string())]);
@@ -197,34 +197,40 @@ pub fn changed_new_lines_by_path(diff: &str) -> Result<BTreeMap<String, BTreeSet
     let mut new_line: Option<u32> = None;
 
     for line in diff.lines() {
-        if let Some(path) = line.strip_prefix("+++ b/") {
-            current_path = Some(path.to_string());
-            changed.entry(path.to_string()).or_default();
-            new_line = None;
-            continue;
-        }
-        if line.starts_with("+++ /dev/null") {
-            current_path = None;
-            new_line = None;
-            continue;
-        }
-        if line.starts_with("@@ ") {
+        // Dispatch on the first byte: content lines dominate a diff, so the
+        // `+++`/`@@` header probes only run on lines that can be headers.
+        let first = line.as_bytes().first().copied();
+        if first == Some(b'+') {
+            if let Some(path) = line.strip_prefix("+++ b/") {
+                changed.entry(path.to_string()).or_default();
+                current_path = Some(path.to_string());
+                new_line = None;
+                continue;
+            }
+            if line.starts_with("+++ /dev/null") {
+                current_path = None;
+                new_line = None;
+                continue;
+            }
+        } else if first == Some(b'@') && line.starts_with("@@ ") {
             new_line = Some(parse_hunk_new_start(line)?);
             continue;
         }
-        let Some(path) = current_path.as_ref() else {
-            continue;
-        };
-        let Some(line_no) = new_line else {
+        let (Some(path), Some(line_no)) = (current_path.as_deref(), new_line) else {
             continue;
         };
-        if line.starts_with('+') && !line.starts_with("+++") {
-            changed.entry(path.clone()).or_default().insert(line_no);
-            new_line = Some(line_no + 1);
-        } else if (line.starts_with('-') && !line.starts_with("---")) || line.starts_with('\\') {
-            continue;
-        } else {
-            new_line = Some(line_no + 1);
+        match first {
+            Some(b'+') if !line.starts_with("+++") => {
+                // The entry was created when `+++ b/<path>` set current_path,
+                // so look it up in place rather than cloning the path per line.
+                if let Some(lines) = changed.get_mut(path) {
+                    lines.insert(line_no);
+                }
+                new_line = Some(line_no + 1);
+            }
+            Some(b'-') if !line.starts_with("---") => {}
+            Some(b'\\') => {}
+            _ => new_line = Some(line_no + 1),
         }
     }
 
@@ -760,6 +766,36 @@ mod tests {
         assert!(!ratio_lines.contains(&6));
     }
 
+    #[test]
+    fn maps_changed_lines_across_files_deletions_and_no_newline_markers() {
+        let diff = "\
+diff --git a/src/a.rs b/src/a.rs
+--- a/src/a.rs
++++ b/src/a.rs
+@@ -1,3 +1,3 @@
+ keep
+-old
++new
+\\ No newline at end of file
+diff --git a/src/gone.rs b/src/gone.rs
+--- a/src/gone.rs
++++ /dev/null
+@@ -1 +0,0 @@
+-removed
+diff --git a/src/b.rs b/src/b.rs
+--- a/src/b.rs
++++ b/src/b.rs
+@@ -10,2 +10,3 @@ fn ctx()
+ ctx
++added
+ tail
+";
+        let changed = changed_new_lines_by_path(diff).unwrap();
+        assert_eq!(changed.len(), 2);
+        assert_eq!(changed["src/a.rs"], BTreeSet::from([2]));
+        assert_eq!(changed["src/b.rs"], BTreeSet::from([11]));
+    }
+
     #[test]
     fn builds_inline_review_only_for_mappable_comments() {
         let request = request();
@@ -6,6 +6,12 @@ pub(crate) fn opencode_telemetry(stdout: &[u8], model_fallback: Option<&str>) ->
     let raw = String::from_utf8_lossy(stdout);
     let mut telemetry = ReviewTelemetry::default();
     for line in raw.lines() {
+        // Every field read below is an object member, so a line that cannot
+        // open a JSON object (plain log text, blank lines) carries nothing
+        // and is skipped without a serde_json parse attempt.
+        if !line.trim_start().starts_with('{') {
+            continue;
+        }
         let Ok(value) = serde_json::from_str::<Value>(line) else {
             continue;
         };
@@ -127,6 +133,19 @@ mod tests {
         assert_eq!(usage.completion_tokens, Some(3));
     }
 
+    #[test]
+    fn opencode_telemetry_reads_only_object_lines() {
+        // Plain text, top-level arrays, and scalars carry no event fields;
+        // only the object line may contribute.
+        let stdout = b"starting review\n\n[{\"model\":\"array/model\",\"cost\":9}]\n42\n\"model\"\n  {\"model\":\"fake/model\",\"cost\":0.5}\nnot json {\n";
+
+        let telemetry = opencode_telemetry(stdout, None);
+
+        assert_eq!(telemetry.model.as_deref(), Some("fake/model"));
+        assert_eq!(telemetry.cost_usd, Some(0.5));
+        assert!(telemetry.usage.is_none());
+    }
+
     #[test]
     fn omp_telemetry_records_configured_model_only() {
         let telemetry = omp_telemetry(Some("omp/model"));